@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration — multi-process production entrypoint
+Run with: gunicorn server:app -c gunicorn_conf.py
+Each worker is its own process with its own model copy (weights are tiny),
+so independent inference requests run in parallel across cores.
+"""
+
+import os
+
+# Workers record metrics in shared mmap files so any worker can answer a
+# /metrics scrape with pod-wide numbers. Must be set before prometheus_client
+# is imported; the gunicorn master loads this file before forking workers.
+PROMETHEUS_DIR = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus-multiproc"
+)
+os.makedirs(PROMETHEUS_DIR, exist_ok=True)
+
+bind = "0.0.0.0:8080"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WORKERS", 2 * (os.cpu_count() or 1) + 1))
+accesslog = None  # Prometheus metrics cover request accounting
+
+
+def child_exit(server, worker):
+    # Retire the dead worker's mmap files so live* gauge aggregation and
+    # counter totals stay correct across worker restarts.
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
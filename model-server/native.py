@@ -0,0 +1,111 @@
+"""
+Native predict kernel
+Compiles the whole predict (matmul + softmax + argmax) into one C function
+at startup and binds it with cffi — eliminates the per-request C-API
+overhead of chaining several NumPy calls on a tiny 4x3 model.
+"""
+
+import os
+import logging
+import tempfile
+import subprocess
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# One pass per row: 3 unrolled dot-products, branchless-ish max, expf,
+# normalize, argmax — no intermediate buffers. The weight shape is fixed at
+# load time, so the actual weight values are baked in as float immediates:
+# partial evaluation removes the weight loads and lets the compiler schedule
+# the whole row as 3 FMA chains.
+KERNEL_TEMPLATE = """
+#include <math.h>
+
+void predict4x3(const float *x, int n, float *probs, int *idx)
+{{
+    for (int i = 0; i < n; i++) {{
+        const float *xi = x + 4 * i;
+        float l0 = xi[0]*{w00}f + xi[1]*{w10}f + xi[2]*{w20}f + xi[3]*{w30}f;
+        float l1 = xi[0]*{w01}f + xi[1]*{w11}f + xi[2]*{w21}f + xi[3]*{w31}f;
+        float l2 = xi[0]*{w02}f + xi[1]*{w12}f + xi[2]*{w22}f + xi[3]*{w32}f;
+        float m = l0 > l1 ? l0 : l1;
+        m = l2 > m ? l2 : m;
+        float e0 = expf(l0 - m);
+        float e1 = expf(l1 - m);
+        float e2 = expf(l2 - m);
+        float inv = 1.0f / (e0 + e1 + e2);
+        float *p = probs + 3 * i;
+        p[0] = e0 * inv;
+        p[1] = e1 * inv;
+        p[2] = e2 * inv;
+        int k = p[1] > p[0] ? 1 : 0;
+        if (p[2] > p[k]) k = 2;
+        idx[i] = k;
+    }}
+}}
+"""
+
+CDEF = "void predict4x3(const float *x, int n, float *probs, int *idx);"
+
+
+def render_source(weights: np.ndarray) -> str:
+    """Specialize the kernel template with the loaded weight constants."""
+    w = np.asarray(weights, dtype=np.float32)
+    consts = {f"w{r}{c}": repr(float(w[r, c])) for r in range(4) for c in range(3)}
+    return KERNEL_TEMPLATE.format(**consts)
+
+CFLAGS = ["-O3", "-march=native", "-ffast-math", "-shared", "-fPIC"]
+
+
+class NativeKernel:
+    """cffi binding around the compiled predict4x3 shared library."""
+
+    def __init__(self, ffi, lib):
+        self._ffi = ffi
+        self._lib = lib
+
+    def predict(self, inputs: np.ndarray):
+        """Run the fused kernel; returns (probs, predicted_idx)."""
+        x = np.ascontiguousarray(inputs, dtype=np.float32)
+        n = x.shape[0]
+        probs = np.empty((n, 3), dtype=np.float32)
+        idx = np.empty(n, dtype=np.int32)
+        self._lib.predict4x3(
+            self._ffi.cast("const float *", x.ctypes.data),
+            n,
+            self._ffi.cast("float *", probs.ctypes.data),
+            self._ffi.cast("int *", idx.ctypes.data),
+        )
+        return probs, idx
+
+
+def build(weights: np.ndarray):
+    """Codegen, compile and bind a kernel specialized for these weights.
+
+    Returns a NativeKernel or None. Any failure (no cffi, no compiler)
+    logs a warning and returns None so the caller falls back to NumPy.
+    """
+    try:
+        import cffi
+    except ImportError:
+        logger.warning("cffi not installed — native kernel disabled")
+        return None
+
+    try:
+        tmpdir = tempfile.mkdtemp(prefix="iris-kernel-")
+        src = os.path.join(tmpdir, "kernel.c")
+        lib_path = os.path.join(tmpdir, "kernel.so")
+        with open(src, "w") as f:
+            f.write(render_source(weights))
+        subprocess.run(
+            ["cc", *CFLAGS, src, "-o", lib_path],
+            check=True, capture_output=True,
+        )
+        ffi = cffi.FFI()
+        ffi.cdef(CDEF)
+        lib = ffi.dlopen(lib_path)
+        logger.info(f"Native predict kernel compiled at {lib_path}")
+        return NativeKernel(ffi, lib)
+    except Exception as exc:
+        logger.warning(f"Native kernel build failed ({exc}) — using NumPy path")
+        return None
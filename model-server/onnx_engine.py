@@ -0,0 +1,82 @@
+"""
+ONNX Runtime engine
+Exports the classifier as a MatMul -> Softmax / ArgMax graph at startup and
+runs it through onnxruntime — the graph executor fuses the whole predict
+into one optimized call with no Python numeric glue per request.
+"""
+
+import os
+import logging
+import tempfile
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class OnnxEngine:
+    """Thin wrapper around an onnxruntime InferenceSession."""
+
+    def __init__(self, session):
+        self._session = session
+
+    def predict(self, inputs: np.ndarray):
+        """Run the fused graph; returns (probs, predicted_idx)."""
+        x = np.ascontiguousarray(inputs, dtype=np.float32)
+        probs, idx = self._session.run(None, {"x": x})
+        return probs, idx
+
+
+def _build_graph(weights: np.ndarray):
+    """Assemble the MatMul -> Softmax / ArgMax graph with onnx.helper."""
+    from onnx import TensorProto, helper, numpy_helper
+
+    w = numpy_helper.from_array(weights.astype(np.float32), name="weights")
+    nodes = [
+        helper.make_node("MatMul", ["x", "weights"], ["logits"]),
+        helper.make_node("Softmax", ["logits"], ["probs"], axis=1),
+        helper.make_node("ArgMax", ["logits"], ["idx"], axis=1, keepdims=0),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        "iris-classifier",
+        inputs=[helper.make_tensor_value_info("x", TensorProto.FLOAT, [None, 4])],
+        outputs=[
+            helper.make_tensor_value_info("probs", TensorProto.FLOAT, [None, 3]),
+            helper.make_tensor_value_info("idx", TensorProto.INT64, [None]),
+        ],
+        initializer=[w],
+    )
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+
+
+def build(weights: np.ndarray):
+    """Export the graph and open a CPU session; returns OnnxEngine or None.
+
+    Any failure (onnx/onnxruntime not installed) logs a warning and returns
+    None so the caller falls back to the next engine.
+    """
+    try:
+        import onnx
+        import onnxruntime as ort
+    except ImportError:
+        logger.warning("onnx/onnxruntime not installed — ONNX engine disabled")
+        return None
+
+    try:
+        model = _build_graph(weights)
+        onnx.checker.check_model(model)
+        path = os.path.join(tempfile.mkdtemp(prefix="iris-onnx-"), "model.onnx")
+        onnx.save(model, path)
+
+        options = ort.SessionOptions()
+        # One intra-op thread: gunicorn workers already fill the cores, and
+        # a 4x3 matmul gains nothing from an internal thread pool.
+        options.intra_op_num_threads = 1
+        session = ort.InferenceSession(
+            path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        logger.info(f"ONNX engine loaded from {path}")
+        return OnnxEngine(session)
+    except Exception as exc:
+        logger.warning(f"ONNX engine build failed ({exc}) — falling back")
+        return None
@@ -2,68 +2,110 @@
 """
 Load test script — trigger HPA by hammering the inference endpoint.
 Usage:
-  pip install httpx
+  pip install httpx orjson numpy
   python scripts/load_test.py --url http://localhost:8080 --rps 200 --duration 60
 """
 
 import asyncio
 import httpx
 import argparse
+import base64
+import struct
+import math
 import time
-import statistics
+import orjson
+import numpy as np
 from datetime import datetime
 
 
+FEATURES = [5.1, 3.5, 1.4, 0.2]
+
+# Binary payload: base64 FP32 bytes decode to one memcpy server-side,
+# vs per-element float parsing for JSON lists.
 PAYLOAD = {
     "inputs": [{
         "name": "input",
         "shape": [1, 4],
         "datatype": "FP32",
-        "data": [5.1, 3.5, 1.4, 0.2]
+        "binary_data": base64.b64encode(struct.pack("<4f", *FEATURES)).decode()
     }]
 }
 
+# Encode once — every request sends the same bytes, so per-request JSON
+# re-encoding is pure overhead.
+PAYLOAD_BYTES = orjson.dumps(PAYLOAD)
+HEADERS = {"content-type": "application/json"}
+
+# Assumed worst-case server latency used to size the worker pool.
+ASSUMED_LATENCY_S = 0.05
+
 async def send_request(client: httpx.AsyncClient, url: str, results: list):
     start = time.time()
     try:
-        resp = await client.post(f"{url}/v2/models/iris-classifier/infer", json=PAYLOAD, timeout=5.0)
+        resp = await client.post(
+            f"{url}/v2/models/iris-classifier/infer",
+            content=PAYLOAD_BYTES, headers=HEADERS, timeout=5.0
+        )
         duration = time.time() - start
         results.append({"status": resp.status_code, "duration": duration, "ok": resp.status_code == 200})
     except Exception as e:
         results.append({"status": 0, "duration": time.time() - start, "ok": False, "error": str(e)})
 
-async def run_load_test(url: str, rps: int, duration: int):
+async def worker(client: httpx.AsyncClient, url: str, results: list,
+                 end_time: float, interval: float):
+    """One paced request at a time — constant concurrency, no task pileup."""
+    while time.time() < end_time:
+        start = time.time()
+        await send_request(client, url, results)
+        sleep = interval - (time.time() - start)
+        if sleep > 0:
+            await asyncio.sleep(sleep)
+
+def make_client(rps: int) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=rps * 2, max_keepalive_connections=rps)
+    try:
+        return httpx.AsyncClient(http2=True, limits=limits)
+    except ImportError:
+        # h2 not installed — HTTP/1.1 with keep-alive still reuses connections
+        return httpx.AsyncClient(limits=limits)
+
+async def run_load_test(url: str, rps: int, duration: int, concurrency: int = 0):
     results = []
-    interval = 1.0 / rps
+    if concurrency <= 0:
+        # Enough in-flight requests to sustain the target rate at the
+        # assumed latency (Little's law), capped to something sane.
+        concurrency = min(max(1, math.ceil(rps * ASSUMED_LATENCY_S)), 256)
+    interval = concurrency / rps
     end_time = time.time() + duration
 
     print(f"\n🚀 Load test started")
     print(f"   Target: {url}")
-    print(f"   Rate: {rps} req/s for {duration}s\n")
-
-    async with httpx.AsyncClient() as client:
-        tasks = []
-        while time.time() < end_time:
-            task = asyncio.create_task(send_request(client, url, results))
-            tasks.append(task)
-            await asyncio.sleep(interval)
+    print(f"   Rate: {rps} req/s for {duration}s ({concurrency} workers)\n")
 
-        await asyncio.gather(*tasks)
+    async with make_client(rps) as client:
+        await asyncio.gather(*[
+            worker(client, url, results, end_time, interval)
+            for _ in range(concurrency)
+        ])
 
     # ── Report ────────────────────────────────────────────────────────────────
     total = len(results)
     success = sum(1 for r in results if r["ok"])
-    latencies = [r["duration"] for r in results if r["ok"]]
+    # One O(n) selection pass for all percentiles vs sorting repeatedly.
+    latencies = np.fromiter(
+        (r["duration"] for r in results if r["ok"]), dtype=np.float64
+    )
 
     print("=" * 50)
     print(f"  Total requests:  {total}")
     print(f"  Successes:       {success} ({100*success/total:.1f}%)")
     print(f"  Failures:        {total - success}")
-    if latencies:
-        print(f"  Latency p50:     {statistics.median(latencies)*1000:.1f}ms")
-        print(f"  Latency p95:     {sorted(latencies)[int(0.95*len(latencies))]*1000:.1f}ms")
-        print(f"  Latency p99:     {sorted(latencies)[int(0.99*len(latencies))]*1000:.1f}ms")
-        print(f"  Max latency:     {max(latencies)*1000:.1f}ms")
+    if latencies.size:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        print(f"  Latency p50:     {p50*1000:.1f}ms")
+        print(f"  Latency p95:     {p95*1000:.1f}ms")
+        print(f"  Latency p99:     {p99*1000:.1f}ms")
+        print(f"  Max latency:     {latencies.max()*1000:.1f}ms")
     print("=" * 50)
     print(f"\n📊 Watch HPA scale up:")
     print(f"   kubectl get hpa -n ai-inference -w")
@@ -73,6 +115,8 @@ if __name__ == "__main__":
     parser.add_argument("--url", default="http://localhost:8080", help="Server URL")
     parser.add_argument("--rps", type=int, default=50, help="Requests per second")
     parser.add_argument("--duration", type=int, default=60, help="Duration in seconds")
+    parser.add_argument("--concurrency", type=int, default=0,
+                        help="Worker count (0 = derive from --rps)")
     args = parser.parse_args()
 
-    asyncio.run(run_load_test(args.url, args.rps, args.duration))
+    asyncio.run(run_load_test(args.url, args.rps, args.duration, args.concurrency))
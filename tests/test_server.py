@@ -81,6 +81,23 @@ class TestInference:
         # Batch of 3 → 3 rows of probabilities
         assert len(probs_output["data"]) == 3
 
+    def test_binary_input_inference(self):
+        """base64-encoded FP32 bytes instead of a JSON list"""
+        import base64
+        import struct
+        payload = {
+            "inputs": [{
+                "name": "input",
+                "shape": [1, 4],
+                "datatype": "FP32",
+                "binary_data": base64.b64encode(struct.pack("<4f", 5.1, 3.5, 1.4, 0.2)).decode()
+            }]
+        }
+        response = client.post("/v2/models/iris-classifier/infer", json=payload)
+        assert response.status_code == 200
+        probs = response.json()["outputs"][0]["data"][0]
+        assert len(probs) == 3
+
     def test_inference_output_probabilities_sum_to_one(self):
         """Probabilities must sum to ~1.0"""
         payload = {
@@ -95,6 +112,25 @@ class TestInference:
         probs = response.json()["outputs"][0]["data"][0]
         assert abs(sum(probs) - 1.0) < 0.001, "Probabilities must sum to 1.0"
 
+    def test_class_only_inference_skips_probabilities(self):
+        """include_probs=false returns predicted_class + confidence only"""
+        payload = {
+            "inputs": [{
+                "name": "input",
+                "shape": [1, 4],
+                "datatype": "FP32",
+                "data": [5.1, 3.5, 1.4, 0.2]
+            }]
+        }
+        response = client.post(
+            "/v2/models/iris-classifier/infer?include_probs=false", json=payload
+        )
+        assert response.status_code == 200
+        names = [o["name"] for o in response.json()["outputs"]]
+        assert "probabilities" not in names
+        assert "predicted_class" in names
+        assert "confidence" in names
+
     def test_predicted_class_is_valid(self):
         """Predicted class must be one of the 3 iris species"""
         valid_classes = {"setosa", "versicolor", "virginica"}
@@ -111,6 +147,26 @@ class TestInference:
         assert predicted in valid_classes
 
 
+    def test_integer_class_ids_via_accept_header(self):
+        """Accept: application/x-ids returns INT32 class ids"""
+        payload = {
+            "inputs": [{
+                "name": "input",
+                "shape": [1, 4],
+                "datatype": "FP32",
+                "data": [5.1, 3.5, 1.4, 0.2]
+            }]
+        }
+        response = client.post(
+            "/v2/models/iris-classifier/infer", json=payload,
+            headers={"accept": "application/x-ids"}
+        )
+        assert response.status_code == 200
+        class_output = next(o for o in response.json()["outputs"] if o["name"] == "predicted_class")
+        assert class_output["datatype"] == "INT32"
+        assert class_output["data"][0] in (0, 1, 2)
+
+
 class TestMetrics:
     def test_prometheus_metrics_endpoint(self):
         """Prometheus /metrics must return valid text"""
@@ -133,3 +189,16 @@ class TestMetrics:
         # Check incremented
         after = client.get("/metrics").text
         assert "inference_requests_total" in after
+
+    def test_duplicate_inputs_hit_prediction_cache(self):
+        """Identical payloads should be served from the LRU cache"""
+        payload = {
+            "inputs": [{"name": "input", "shape": [1, 4], "datatype": "FP32", "data": [4.9, 3.0, 1.4, 0.2]}]
+        }
+        first = client.post("/v2/models/iris-classifier/infer", json=payload)
+        second = client.post("/v2/models/iris-classifier/infer", json=payload)
+        assert first.json()["outputs"] == second.json()["outputs"]
+
+        metrics = client.get("/metrics").text
+        hits = [l for l in metrics.split("\n") if l.startswith("inference_cache_hits_total")]
+        assert hits and float(hits[0].split()[-1]) >= 1